@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+AgentDB Similarity Kernel Builder
+
+Ahead-of-time compiles the embedding similarity kernels into a ``simkernels``
+extension module with Numba's pycc, so test runs import native code instead of
+paying JIT compile time in every new process. test_agentdb.py falls back to
+the ``@njit(cache=True)`` kernel (or plain NumPy) when the module is absent.
+Both compile the same source, scripts/simkernels_src.py.
+
+numba.pycc is pending deprecation: importing it emits a
+NumbaPendingDeprecationWarning (numba 0.57+). If a future numba drops it, this
+script exits with an error and the tests keep using the JIT kernel.
+
+Usage:
+    python scripts/_build_simkernels.py [--output-dir DIR]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+from simkernels_src import batch_cosine
+
+
+def build_module():
+    """Return a pycc CC for the simkernels module, or None if pycc is unavailable."""
+    try:
+        from numba.pycc import CC
+    except ImportError:
+        return None
+
+    cc = CC('simkernels')
+    cc.export('batch_cosine', 'f4[:](f4[:,::1], f4[::1])')(batch_cosine)
+    return cc
+
+
+def main():
+    """Command-line interface for building the kernel module."""
+    parser = argparse.ArgumentParser(
+        description="Ahead-of-time compile the AgentDB similarity kernels"
+    )
+
+    parser.add_argument(
+        '--output-dir',
+        default=str(Path(__file__).resolve().parent),
+        help='Directory for the compiled module (default: next to this script)'
+    )
+
+    args = parser.parse_args()
+
+    cc = build_module()
+    if cc is None:
+        print("❌ numba.pycc is not available in this numba; tests fall back to the JIT kernel")
+        sys.exit(1)
+
+    cc.output_dir = args.output_dir
+    cc.compile()
+    print(f"✅ Built simkernels in {args.output_dir}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
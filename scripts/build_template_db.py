@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+AgentDB Template Database Builder
+
+Builds the empty ReasoningBank template database that init_agentdb.py copies
+instead of running the schema DDL. Re-run and commit the result whenever the
+schema in init_agentdb.py changes; a stale template is detected and ignored.
+
+Usage:
+    python scripts/build_template_db.py [--output PATH]
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+from init_agentdb import AgentDBInitializer, TEMPLATE_DB_PATH
+
+
+def main():
+    """Command-line interface for building the template database."""
+    parser = argparse.ArgumentParser(
+        description="Build the empty AgentDB ReasoningBank template database"
+    )
+
+    parser.add_argument(
+        '--output',
+        default=str(TEMPLATE_DB_PATH),
+        help=f'Template path (default: {TEMPLATE_DB_PATH})'
+    )
+
+    args = parser.parse_args()
+    output = Path(args.output)
+
+    # Always build from scratch so the template contains nothing but the schema
+    for path in (output, Path(f"{output}-wal"), Path(f"{output}-shm")):
+        if path.exists():
+            os.remove(path)
+
+    initializer = AgentDBInitializer(
+        db_path=str(output),
+        backup=False,
+        use_template=False
+    )
+
+    success = initializer.initialize(force=True)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
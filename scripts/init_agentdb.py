@@ -2,39 +2,566 @@
 """
 AgentDB ReasoningBank Database Initialization Script
 
-Creates a complete SQLite database with all 25 required tables for AgentDB,
+Creates a complete SQLite database with all required tables for AgentDB,
 including proper indexes, foreign keys, and schema validation.
 
+New databases are copied from packaged/reasoningbank_template.db when that
+template matches the current schema (see scripts/build_template_db.py).
+
 Usage:
-    python scripts/init_agentdb.py [--backup] [--force]
+    python scripts/init_agentdb.py [--backup] [--force] [--verbose]
 """
 
 import sqlite3
 import os
+import sys
 import shutil
 import argparse
+import zlib
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Only needed by the embedding pack/unpack helpers
+    np = None
+
+
+# Per-connection settings; SQLite resets these every time a connection is opened
+RUNTIME_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL;",      # Safe with WAL, avoids the per-commit double fsync
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA cache_size = -65536;",       # 64 MiB page cache
+    "PRAGMA mmap_size = 268435456;",     # 256 MiB memory-mapped I/O
+    "PRAGMA busy_timeout = 5000;",
+    "PRAGMA foreign_keys = ON;",
+]
+
+# Used only while creating a brand-new database: nothing to protect yet,
+# so skip journal writes and fsyncs entirely (restored before closing)
+BULK_LOAD_PRAGMAS = [
+    "PRAGMA journal_mode = OFF;",
+    "PRAGMA synchronous = OFF;",
+    "PRAGMA foreign_keys = OFF;",
+]
+
+# Embedding storage: all-MiniLM-L6-v2 vectors, stored int8-quantized (see pack_int8)
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBEDDING_DIM = 384
+EMBEDDING_TABLES = ['episode_embeddings', 'skill_embeddings', 'note_embeddings', 'exp_node_embeddings']
+
+# STRICT tables need SQLite 3.37+, DEFAULT (unixepoch()) needs 3.38+
+MIN_SQLITE_VERSION = (3, 38, 0)
+
+# Databases up to this size are backed up with a plain file copy;
+# larger ones go through the online backup API in steps of this many pages
+BACKUP_COPY_MAX_BYTES = 1024 * 1024
+BACKUP_PAGES_PER_STEP = 1000
+
+
+# Schema definition: (table name, CREATE TABLE statement) for every table.
+# Embedding tables are STRICT: no per-value type affinity, denser pages for vector scans.
+# Timestamps are INTEGER unix epoch seconds (unixepoch() needs SQLite 3.38+).
+TABLES: list[tuple[str, str]] = [
+    # 1. Episodes - Core reasoning episodes
+    ("episodes", """
+        CREATE TABLE IF NOT EXISTS episodes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts REAL NOT NULL,
+            session_id TEXT,
+            task TEXT NOT NULL,
+            input TEXT,
+            output TEXT,
+            critique TEXT,
+            reward REAL,
+            success INTEGER,
+            latency_ms INTEGER,
+            tokens_used INTEGER,
+            tags TEXT,
+            metadata TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 2. Episode Embeddings - Vector embeddings for episodes
+    ("episode_embeddings", """
+        CREATE TABLE IF NOT EXISTS episode_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            embedding BLOB NOT NULL,
+            quant_scheme TEXT DEFAULT 'int8_sym',
+            model_id INTEGER NOT NULL DEFAULT 1 REFERENCES embedding_models(id),
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
+        ) STRICT;
+    """),
+
+    # 3. Skills - Learned skills and patterns
+    ("skills", """
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            description TEXT,
+            code TEXT,
+            success_rate REAL DEFAULT 0.0,
+            usage_count INTEGER DEFAULT 0,
+            avg_reward REAL DEFAULT 0.0,
+            tags TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            updated_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 4. Skill Embeddings
+    ("skill_embeddings", """
+        CREATE TABLE IF NOT EXISTS skill_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            skill_id INTEGER NOT NULL,
+            embedding BLOB NOT NULL,
+            quant_scheme TEXT DEFAULT 'int8_sym',
+            model_id INTEGER NOT NULL DEFAULT 1 REFERENCES embedding_models(id),
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+        ) STRICT;
+    """),
+
+    # 5. Skill Links - Episode to skill relationships
+    ("skill_links", """
+        CREATE TABLE IF NOT EXISTS skill_links (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+            relevance REAL DEFAULT 1.0,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE,
+            FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE,
+            UNIQUE(episode_id, skill_id)
+        );
+    """),
+
+    # 6. Facts - Declarative knowledge
+    ("facts", """
+        CREATE TABLE IF NOT EXISTS facts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            confidence REAL DEFAULT 1.0,
+            source TEXT,
+            tags TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            updated_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 7. Notes - User annotations and observations
+    ("notes", """
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            episode_id INTEGER,
+            tags TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE SET NULL
+        );
+    """),
+
+    # 8. Note Embeddings
+    ("note_embeddings", """
+        CREATE TABLE IF NOT EXISTS note_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            note_id INTEGER NOT NULL,
+            embedding BLOB NOT NULL,
+            quant_scheme TEXT DEFAULT 'int8_sym',
+            model_id INTEGER NOT NULL DEFAULT 1 REFERENCES embedding_models(id),
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (note_id) REFERENCES notes(id) ON DELETE CASCADE
+        ) STRICT;
+    """),
+
+    # 9. Causal Edges - Causal relationships
+    ("causal_edges", """
+        CREATE TABLE IF NOT EXISTS causal_edges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            cause_id INTEGER NOT NULL,
+            effect_id INTEGER NOT NULL,
+            strength REAL DEFAULT 0.5,
+            confidence REAL DEFAULT 0.5,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (cause_id) REFERENCES episodes(id) ON DELETE CASCADE,
+            FOREIGN KEY (effect_id) REFERENCES episodes(id) ON DELETE CASCADE,
+            UNIQUE(cause_id, effect_id)
+        );
+    """),
+
+    # 10. Causal Experiments - Experimental interventions
+    ("causal_experiments", """
+        CREATE TABLE IF NOT EXISTS causal_experiments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT,
+            hypothesis TEXT,
+            intervention TEXT,
+            outcome TEXT,
+            success INTEGER,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 11. Causal Observations - Observation data
+    ("causal_observations", """
+        CREATE TABLE IF NOT EXISTS causal_observations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            experiment_id INTEGER NOT NULL,
+            variable_name TEXT NOT NULL,
+            variable_value TEXT,
+            observed_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (experiment_id) REFERENCES causal_experiments(id) ON DELETE CASCADE
+        );
+    """),
+
+    # 12. Exp Nodes - Exploration graph nodes
+    ("exp_nodes", """
+        CREATE TABLE IF NOT EXISTS exp_nodes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            state TEXT NOT NULL,
+            visit_count INTEGER DEFAULT 0,
+            value REAL DEFAULT 0.0,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            updated_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 13. Exp Edges - Exploration graph edges
+    ("exp_edges", """
+        CREATE TABLE IF NOT EXISTS exp_edges (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            from_node_id INTEGER NOT NULL,
+            to_node_id INTEGER NOT NULL,
+            action TEXT,
+            reward REAL DEFAULT 0.0,
+            visit_count INTEGER DEFAULT 0,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (from_node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE,
+            FOREIGN KEY (to_node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE,
+            UNIQUE(from_node_id, to_node_id, action)
+        );
+    """),
+
+    # 14. Exp Node Embeddings
+    ("exp_node_embeddings", """
+        CREATE TABLE IF NOT EXISTS exp_node_embeddings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            node_id INTEGER NOT NULL,
+            embedding BLOB NOT NULL,
+            quant_scheme TEXT DEFAULT 'int8_sym',
+            model_id INTEGER NOT NULL DEFAULT 1 REFERENCES embedding_models(id),
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE
+        ) STRICT;
+    """),
+
+    # 15. Learning Experiences - Individual learning events
+    ("learning_experiences", """
+        CREATE TABLE IF NOT EXISTS learning_experiences (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER NOT NULL,
+            episode_id INTEGER,
+            experience_type TEXT,
+            input_data TEXT,
+            output_data TEXT,
+            reward REAL,
+            success INTEGER,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (session_id) REFERENCES learning_sessions(id) ON DELETE CASCADE,
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE SET NULL
+        );
+    """),
+
+    # 16. Learning Sessions - Training sessions
+    ("learning_sessions", """
+        CREATE TABLE IF NOT EXISTS learning_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            algorithm TEXT NOT NULL,
+            config TEXT,
+            start_time INTEGER NOT NULL DEFAULT (unixepoch()),
+            end_time INTEGER,
+            status TEXT DEFAULT 'active',
+            metrics TEXT
+        );
+    """),
+
+    # 17. Consolidated Memories - Compressed memory summaries
+    ("consolidated_memories", """
+        CREATE TABLE IF NOT EXISTS consolidated_memories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            summary TEXT NOT NULL,
+            source_episode_ids TEXT,
+            consolidation_run_id INTEGER,
+            importance_score REAL DEFAULT 0.5,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (consolidation_run_id) REFERENCES consolidation_runs(id) ON DELETE SET NULL
+        );
+    """),
+
+    # 18. Consolidation Runs - Memory consolidation processes
+    ("consolidation_runs", """
+        CREATE TABLE IF NOT EXISTS consolidation_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_type TEXT NOT NULL,
+            episodes_processed INTEGER DEFAULT 0,
+            memories_created INTEGER DEFAULT 0,
+            compression_ratio REAL,
+            started_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            completed_at INTEGER
+        );
+    """),
+
+    # 19. Memory Scores - Memory importance tracking
+    ("memory_scores", """
+        CREATE TABLE IF NOT EXISTS memory_scores (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            recency_score REAL DEFAULT 0.0,
+            frequency_score REAL DEFAULT 0.0,
+            importance_score REAL DEFAULT 0.0,
+            composite_score REAL DEFAULT 0.0,
+            last_accessed INTEGER NOT NULL DEFAULT (unixepoch()),
+            access_count INTEGER DEFAULT 0,
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE,
+            UNIQUE(episode_id)
+        );
+    """),
+
+    # 20. Memory Access Log - Track memory access patterns
+    ("memory_access_log", """
+        CREATE TABLE IF NOT EXISTS memory_access_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            access_type TEXT,
+            context TEXT,
+            accessed_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
+        );
+    """),
+
+    # 21. Provenance Sources - Track data origins
+    ("provenance_sources", """
+        CREATE TABLE IF NOT EXISTS provenance_sources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT NOT NULL,
+            source_id TEXT NOT NULL,
+            content TEXT,
+            metadata TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            UNIQUE(source_type, source_id)
+        );
+    """),
+
+    # 22. Justification Paths - Reasoning chains
+    ("justification_paths", """
+        CREATE TABLE IF NOT EXISTS justification_paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            path_data TEXT NOT NULL,
+            confidence REAL DEFAULT 0.5,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
+        );
+    """),
+
+    # 23. Recall Certificates - Verification of memory recall
+    ("recall_certificates", """
+        CREATE TABLE IF NOT EXISTS recall_certificates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            episode_id INTEGER NOT NULL,
+            recall_query TEXT,
+            match_score REAL,
+            provenance_ids TEXT,
+            verified_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
+        );
+    """),
+
+    # 24. Events - General event log
+    ("events", """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT NOT NULL,
+            event_data TEXT,
+            session_id TEXT,
+            timestamp INTEGER NOT NULL DEFAULT (unixepoch()),
+            metadata TEXT
+        );
+    """),
+
+    # 25. Learning Algorithms - Track algorithm configurations
+    ("learning_algorithms", """
+        CREATE TABLE IF NOT EXISTS learning_algorithms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            algorithm_type TEXT NOT NULL,
+            config TEXT,
+            performance_metrics TEXT,
+            created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+            updated_at INTEGER NOT NULL DEFAULT (unixepoch())
+        );
+    """),
+
+    # 26. Embedding Dims - Vector length per embedding table, so readers need not parse BLOBs
+    ("embedding_dims", """
+        CREATE TABLE IF NOT EXISTS embedding_dims (
+            table_name TEXT PRIMARY KEY,
+            dim INTEGER NOT NULL
+        ) STRICT;
+    """),
+
+    # 27. Embedding Models - Shared model names referenced by the embedding tables
+    ("embedding_models", """
+        CREATE TABLE IF NOT EXISTS embedding_models (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL
+        ) STRICT;
+    """),
+]
+
+# Performance indexes: (index name, CREATE INDEX statement).
+# Composite indexes put the filter column first and the sort column second,
+# so "filter + ORDER BY" queries are answered by an index scan alone.
+# Partial indexes (WHERE ...) cover only the hot minority of rows, so they stay small and cached.
+INDEXES: list[tuple[str, str]] = [
+    # Episode indexes
+    ("idx_episodes_ts", "CREATE INDEX IF NOT EXISTS idx_episodes_ts ON episodes(ts);"),
+    ("idx_episodes_session", "CREATE INDEX IF NOT EXISTS idx_episodes_session ON episodes(session_id, ts DESC);"),
+    ("idx_episodes_created", "CREATE INDEX IF NOT EXISTS idx_episodes_created ON episodes(created_at);"),
+    ("idx_episodes_success", "CREATE INDEX IF NOT EXISTS idx_episodes_success ON episodes(ts DESC) WHERE success = 1;"),
+
+    # Embedding indexes
+    ("idx_episode_emb_episode", "CREATE INDEX IF NOT EXISTS idx_episode_emb_episode ON episode_embeddings(episode_id);"),
+    ("idx_episode_emb_model", "CREATE INDEX IF NOT EXISTS idx_episode_emb_model ON episode_embeddings(model_id, episode_id);"),
+    ("idx_skill_emb_skill", "CREATE INDEX IF NOT EXISTS idx_skill_emb_skill ON skill_embeddings(skill_id);"),
+    ("idx_note_emb_note", "CREATE INDEX IF NOT EXISTS idx_note_emb_note ON note_embeddings(note_id);"),
+    ("idx_exp_node_emb_node", "CREATE INDEX IF NOT EXISTS idx_exp_node_emb_node ON exp_node_embeddings(node_id);"),
+
+    # Skill indexes
+    ("idx_skills_name", "CREATE INDEX IF NOT EXISTS idx_skills_name ON skills(name);"),
+    ("idx_skill_links_episode", "CREATE INDEX IF NOT EXISTS idx_skill_links_episode ON skill_links(episode_id);"),
+    ("idx_skill_links_skill", "CREATE INDEX IF NOT EXISTS idx_skill_links_skill ON skill_links(skill_id);"),
+
+    # Learning indexes
+    ("idx_learning_exp_session", "CREATE INDEX IF NOT EXISTS idx_learning_exp_session ON learning_experiences(session_id);"),
+    ("idx_learning_sessions_algo", "CREATE INDEX IF NOT EXISTS idx_learning_sessions_algo ON learning_sessions(algorithm);"),
+    ("idx_learning_sessions_active", "CREATE INDEX IF NOT EXISTS idx_learning_sessions_active ON learning_sessions(start_time DESC) WHERE status = 'active';"),
+
+    # Memory indexes
+    ("idx_memory_scores_ep_comp", "CREATE INDEX IF NOT EXISTS idx_memory_scores_ep_comp ON memory_scores(episode_id, composite_score DESC);"),
+    ("idx_memory_scores_composite", "CREATE INDEX IF NOT EXISTS idx_memory_scores_composite ON memory_scores(composite_score DESC);"),
+    ("idx_memory_scores_high", "CREATE INDEX IF NOT EXISTS idx_memory_scores_high ON memory_scores(composite_score DESC) WHERE composite_score > 0.5;"),
+    ("idx_memory_access_episode", "CREATE INDEX IF NOT EXISTS idx_memory_access_episode ON memory_access_log(episode_id);"),
+
+    # Causal indexes
+    ("idx_causal_edges_cause", "CREATE INDEX IF NOT EXISTS idx_causal_edges_cause ON causal_edges(cause_id);"),
+    ("idx_causal_edges_effect", "CREATE INDEX IF NOT EXISTS idx_causal_edges_effect ON causal_edges(effect_id);"),
+    ("idx_causal_experiments_success", "CREATE INDEX IF NOT EXISTS idx_causal_experiments_success ON causal_experiments(created_at DESC) WHERE success = 1;"),
+
+    # Event indexes
+    ("idx_events_type_ts", "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(event_type, timestamp);"),
+    ("idx_events_timestamp", "CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);"),
+]
+
+SCHEMA_SQL = "\n".join(sql for _, sql in TABLES)
+INDEX_SQL = "\n".join(sql for _, sql in INDEXES)
+# Pre-built empty database shipped with the repo (see scripts/build_template_db.py)
+TEMPLATE_DB_PATH = Path(__file__).resolve().parent.parent / "packaged" / "reasoningbank_template.db"
+
+SEED_SQL = "\n".join(
+    [f"INSERT OR IGNORE INTO embedding_models (id, name) VALUES (1, '{EMBEDDING_MODEL}');"]
+    + [
+        f"INSERT OR IGNORE INTO embedding_dims (table_name, dim) VALUES ('{table}', {EMBEDDING_DIM});"
+        for table in EMBEDDING_TABLES
+    ]
+)
+
+# Fingerprint of the full DDL, stored in PRAGMA user_version so a stale template is never used
+SCHEMA_VERSION = zlib.crc32("\n".join((SCHEMA_SQL, INDEX_SQL, SEED_SQL)).encode()) & 0x7FFFFFFF
+
+# Key columns checked by validate_schema, per table
+REQUIRED_COLUMNS: dict[str, set[str]] = {
+    'episodes': {'id', 'ts', 'task', 'input', 'output', 'reward', 'created_at'},
+    'episode_embeddings': {'episode_id', 'embedding', 'quant_scheme', 'model_id'},
+    'skill_embeddings': {'skill_id', 'embedding', 'quant_scheme', 'model_id'},
+    'note_embeddings': {'note_id', 'embedding', 'quant_scheme', 'model_id'},
+    'exp_node_embeddings': {'node_id', 'embedding', 'quant_scheme', 'model_id'},
+    'embedding_dims': {'table_name', 'dim'},
+    'embedding_models': {'id', 'name'},
+}
+
+
+def pack_int8(vec: "np.ndarray") -> bytes:
+    """Quantize a vector to int8 (symmetric) and pack it as ``int8[d] ++ float32 scale``."""
+    vec = np.asarray(vec, dtype=np.float32)
+    scale = float(np.abs(vec).max()) / 127.0 if vec.size else 0.0
+    if scale > 0.0:
+        quantized = np.clip(np.rint(vec / scale), -127, 127).astype(np.int8)
+    else:
+        quantized = np.zeros(vec.shape, dtype=np.int8)
+    return quantized.tobytes() + np.float32(scale).tobytes()
+
+
+def unpack_int8(blob: bytes) -> "np.ndarray":
+    """Inverse of pack_int8: decode an ``int8[d] ++ float32 scale`` BLOB to float32."""
+    buf = memoryview(blob)
+    scale = np.frombuffer(buf[-4:], dtype=np.float32)[0]
+    return np.frombuffer(buf[:-4], dtype=np.int8).astype(np.float32) * scale
 
 
 class AgentDBInitializer:
     """Handles AgentDB database initialization and schema creation."""
 
-    def __init__(self, db_path: str = ".agentdb/reasoningbank.db", backup: bool = True):
-        self.db_path = db_path
+    def __init__(self, db_path: str = ".agentdb/reasoningbank.db", backup: bool = True,
+                 use_template: bool = True, verbose: bool = False):
+        self.db_path = Path(db_path)
         self.backup = backup
-        self.db_dir = Path(db_path).parent
+        self.use_template = use_template
+        self.verbose = verbose
+        self.db_dir = self.db_path.parent
+
+    def backup_existing_db(self, pre_existed: Optional[bool] = None) -> bool:
+        """Create backup of existing database if present.
 
-    def backup_existing_db(self) -> bool:
-        """Create backup of existing database if present."""
-        if not os.path.exists(self.db_path):
+        Args:
+            pre_existed: Result of an existence check the caller already made;
+                checked here only when not given
+        """
+        if pre_existed is None:
+            pre_existed = self.db_path.is_file()
+        if not pre_existed:
             return False
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = f"{self.db_path}.backup_{timestamp}"
 
         print(f"📦 Backing up existing database to: {backup_path}")
-        shutil.copy2(self.db_path, backup_path)
+
+        src = sqlite3.connect(self.db_path)
+        try:
+            copied = False
+            if os.path.getsize(self.db_path) <= BACKUP_COPY_MAX_BYTES:
+                # Tiny database: fold the WAL into the main file and copy it directly.
+                # busy != 0 means a reader blocked the checkpoint and committed frames
+                # are still only in -wal, so the file alone would be a stale backup.
+                busy, _, _ = src.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone()
+                if busy == 0:
+                    shutil.copyfile(self.db_path, backup_path)
+                    copied = True
+            if not copied:
+                # SQLite online backup: page-by-page, WAL-aware, no torn reads
+                dst = sqlite3.connect(backup_path)
+                try:
+                    src.backup(dst, pages=BACKUP_PAGES_PER_STEP)
+                finally:
+                    dst.close()
+        finally:
+            src.close()
         return True
 
     def create_database_directory(self):
@@ -42,427 +569,103 @@ class AgentDBInitializer:
         self.db_dir.mkdir(parents=True, exist_ok=True)
         print(f"✓ Database directory created: {self.db_dir}")
 
-    def initialize_schema(self, conn: sqlite3.Connection):
-        """Create all 25 required tables with proper schema."""
-        cursor = conn.cursor()
-
-        # Enable foreign key support
-        cursor.execute("PRAGMA foreign_keys = ON;")
-
-        print("\n📊 Creating tables...")
-
-        # 1. Episodes - Core reasoning episodes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS episodes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ts REAL NOT NULL,
-                session_id TEXT,
-                task TEXT NOT NULL,
-                input TEXT,
-                output TEXT,
-                critique TEXT,
-                reward REAL,
-                success INTEGER,
-                latency_ms INTEGER,
-                tokens_used INTEGER,
-                tags TEXT,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ episodes")
-
-        # 2. Episode Embeddings - Vector embeddings for episodes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS episode_embeddings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                embedding BLOB NOT NULL,
-                embedding_model TEXT DEFAULT 'all-MiniLM-L6-v2',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ episode_embeddings")
-
-        # 3. Skills - Learned skills and patterns
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS skills (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                description TEXT,
-                code TEXT,
-                success_rate REAL DEFAULT 0.0,
-                usage_count INTEGER DEFAULT 0,
-                avg_reward REAL DEFAULT 0.0,
-                tags TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ skills")
-
-        # 4. Skill Embeddings
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS skill_embeddings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                skill_id INTEGER NOT NULL,
-                embedding BLOB NOT NULL,
-                embedding_model TEXT DEFAULT 'all-MiniLM-L6-v2',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ skill_embeddings")
-
-        # 5. Skill Links - Episode to skill relationships
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS skill_links (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                skill_id INTEGER NOT NULL,
-                relevance REAL DEFAULT 1.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE,
-                FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE,
-                UNIQUE(episode_id, skill_id)
-            );
-        """)
-        print("  ✓ skill_links")
-
-        # 6. Facts - Declarative knowledge
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS facts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL,
-                confidence REAL DEFAULT 1.0,
-                source TEXT,
-                tags TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ facts")
-
-        # 7. Notes - User annotations and observations
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS notes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL,
-                episode_id INTEGER,
-                tags TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE SET NULL
-            );
-        """)
-        print("  ✓ notes")
-
-        # 8. Note Embeddings
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS note_embeddings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                note_id INTEGER NOT NULL,
-                embedding BLOB NOT NULL,
-                embedding_model TEXT DEFAULT 'all-MiniLM-L6-v2',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (note_id) REFERENCES notes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ note_embeddings")
-
-        # 9. Causal Edges - Causal relationships
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS causal_edges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                cause_id INTEGER NOT NULL,
-                effect_id INTEGER NOT NULL,
-                strength REAL DEFAULT 0.5,
-                confidence REAL DEFAULT 0.5,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (cause_id) REFERENCES episodes(id) ON DELETE CASCADE,
-                FOREIGN KEY (effect_id) REFERENCES episodes(id) ON DELETE CASCADE,
-                UNIQUE(cause_id, effect_id)
-            );
-        """)
-        print("  ✓ causal_edges")
-
-        # 10. Causal Experiments - Experimental interventions
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS causal_experiments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT,
-                hypothesis TEXT,
-                intervention TEXT,
-                outcome TEXT,
-                success INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ causal_experiments")
-
-        # 11. Causal Observations - Observation data
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS causal_observations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                experiment_id INTEGER NOT NULL,
-                variable_name TEXT NOT NULL,
-                variable_value TEXT,
-                observed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (experiment_id) REFERENCES causal_experiments(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ causal_observations")
-
-        # 12. Exp Nodes - Exploration graph nodes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS exp_nodes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                state TEXT NOT NULL,
-                visit_count INTEGER DEFAULT 0,
-                value REAL DEFAULT 0.0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ exp_nodes")
-
-        # 13. Exp Edges - Exploration graph edges
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS exp_edges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                from_node_id INTEGER NOT NULL,
-                to_node_id INTEGER NOT NULL,
-                action TEXT,
-                reward REAL DEFAULT 0.0,
-                visit_count INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (from_node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE,
-                FOREIGN KEY (to_node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE,
-                UNIQUE(from_node_id, to_node_id, action)
-            );
-        """)
-        print("  ✓ exp_edges")
-
-        # 14. Exp Node Embeddings
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS exp_node_embeddings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                node_id INTEGER NOT NULL,
-                embedding BLOB NOT NULL,
-                embedding_model TEXT DEFAULT 'all-MiniLM-L6-v2',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (node_id) REFERENCES exp_nodes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ exp_node_embeddings")
-
-        # 15. Learning Experiences - Individual learning events
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS learning_experiences (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id INTEGER NOT NULL,
-                episode_id INTEGER,
-                experience_type TEXT,
-                input_data TEXT,
-                output_data TEXT,
-                reward REAL,
-                success INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (session_id) REFERENCES learning_sessions(id) ON DELETE CASCADE,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE SET NULL
-            );
-        """)
-        print("  ✓ learning_experiences")
-
-        # 16. Learning Sessions - Training sessions
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS learning_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                algorithm TEXT NOT NULL,
-                config TEXT,
-                start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                end_time TIMESTAMP,
-                status TEXT DEFAULT 'active',
-                metrics TEXT
-            );
-        """)
-        print("  ✓ learning_sessions")
-
-        # 17. Consolidated Memories - Compressed memory summaries
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS consolidated_memories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                summary TEXT NOT NULL,
-                source_episode_ids TEXT,
-                consolidation_run_id INTEGER,
-                importance_score REAL DEFAULT 0.5,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (consolidation_run_id) REFERENCES consolidation_runs(id) ON DELETE SET NULL
-            );
-        """)
-        print("  ✓ consolidated_memories")
+    @classmethod
+    def apply_runtime_pragmas(cls, conn: sqlite3.Connection):
+        """Apply per-connection performance PRAGMAs; call on every new connection."""
+        for pragma in RUNTIME_PRAGMAS:
+            conn.execute(pragma)
 
-        # 18. Consolidation Runs - Memory consolidation processes
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS consolidation_runs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_type TEXT NOT NULL,
-                episodes_processed INTEGER DEFAULT 0,
-                memories_created INTEGER DEFAULT 0,
-                compression_ratio REAL,
-                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            );
-        """)
-        print("  ✓ consolidation_runs")
+    @classmethod
+    def close_gracefully(cls, conn: sqlite3.Connection):
+        """Let SQLite refresh planner statistics, then close the connection."""
+        try:
+            conn.execute("PRAGMA optimize;")
+        except sqlite3.Error:
+            pass  # Best effort: never block closing on statistics
+        finally:
+            conn.close()
 
-        # 19. Memory Scores - Memory importance tracking
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS memory_scores (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                recency_score REAL DEFAULT 0.0,
-                frequency_score REAL DEFAULT 0.0,
-                importance_score REAL DEFAULT 0.0,
-                composite_score REAL DEFAULT 0.0,
-                last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                access_count INTEGER DEFAULT 0,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE,
-                UNIQUE(episode_id)
-            );
-        """)
-        print("  ✓ memory_scores")
+    def _configure_pragmas(self, conn: sqlite3.Connection, bulk_load: bool = False):
+        """Switch the database to WAL (persisted in the file) and apply runtime PRAGMAs.
 
-        # 20. Memory Access Log - Track memory access patterns
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS memory_access_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                access_type TEXT,
-                context TEXT,
-                accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ memory_access_log")
+        With ``bulk_load``, disable journaling, fsyncs and FK checks instead; only
+        safe while creating a brand-new file that can simply be recreated on failure.
+        """
+        # Larger pages fit more embedding BLOBs per page; only applies to a new, empty file
+        conn.execute("PRAGMA page_size = 8192;")
+        if bulk_load:
+            for pragma in BULK_LOAD_PRAGMAS:
+                conn.execute(pragma)
+            return
+
+        conn.execute("PRAGMA journal_mode = WAL;")
+        self.apply_runtime_pragmas(conn)
+
+    def _copy_template(self) -> bool:
+        """Create the database by copying the pre-built template, if it matches this schema."""
+        if not self.use_template or not TEMPLATE_DB_PATH.is_file():
+            return False
 
-        # 21. Provenance Sources - Track data origins
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS provenance_sources (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_type TEXT NOT NULL,
-                source_id TEXT NOT NULL,
-                content TEXT,
-                metadata TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(source_type, source_id)
-            );
-        """)
-        print("  ✓ provenance_sources")
+        # user_version lives at bytes 60-63 of the SQLite header (big-endian)
+        with open(TEMPLATE_DB_PATH, "rb") as f:
+            header = f.read(100)
+        if int.from_bytes(header[60:64], "big") != SCHEMA_VERSION:
+            print("⚠️  Template database is out of date, running full schema creation")
+            return False
 
-        # 22. Justification Paths - Reasoning chains
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS justification_paths (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                path_data TEXT NOT NULL,
-                confidence REAL DEFAULT 0.5,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ justification_paths")
+        print(f"\n📋 Copying template database: {TEMPLATE_DB_PATH}")
+        shutil.copyfile(TEMPLATE_DB_PATH, self.db_path)
+        return True
 
-        # 23. Recall Certificates - Verification of memory recall
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recall_certificates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                episode_id INTEGER NOT NULL,
-                recall_query TEXT,
-                match_score REAL,
-                provenance_ids TEXT,
-                verified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (episode_id) REFERENCES episodes(id) ON DELETE CASCADE
-            );
-        """)
-        print("  ✓ recall_certificates")
+    def _execute_in_transaction(self, conn: sqlite3.Connection, script: str):
+        """Run a multi-statement SQL script atomically.
 
-        # 24. Events - General event log
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_type TEXT NOT NULL,
-                event_data TEXT,
-                session_id TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                metadata TEXT
-            );
-        """)
-        print("  ✓ events")
+        BEGIN/COMMIT live inside the script because executescript() commits
+        any open transaction before running.
+        """
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+    def initialize_schema(self, conn: sqlite3.Connection, with_indexes: bool = True):
+        """Create all required tables (and, by default, their indexes) in a single transaction."""
+        print("\n📊 Creating tables...")
 
-        # 25. Learning Algorithms - Track algorithm configurations
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS learning_algorithms (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                algorithm_type TEXT NOT NULL,
-                config TEXT,
-                performance_metrics TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        print("  ✓ learning_algorithms")
+        # Tables, indexes and seed rows go to SQLite as one script: one parse pass, one commit
+        index_sql = INDEX_SQL if with_indexes else ""
+        self._execute_in_transaction(conn, "\n".join(
+            (SCHEMA_SQL, index_sql, SEED_SQL, f"PRAGMA user_version = {SCHEMA_VERSION};")
+        ))
+        self._report_created(name for name, _ in TABLES)
 
-        conn.commit()
+        if with_indexes:
+            self._report_indexes()
 
     def create_indexes(self, conn: sqlite3.Connection):
-        """Create performance indexes on key columns."""
-        cursor = conn.cursor()
-
-        print("\n🚀 Creating indexes...")
+        """Create performance indexes on key columns in a single transaction.
 
-        indexes = [
-            # Episode indexes
-            ("idx_episodes_ts", "CREATE INDEX IF NOT EXISTS idx_episodes_ts ON episodes(ts);"),
-            ("idx_episodes_session", "CREATE INDEX IF NOT EXISTS idx_episodes_session ON episodes(session_id);"),
-            ("idx_episodes_created", "CREATE INDEX IF NOT EXISTS idx_episodes_created ON episodes(created_at);"),
-
-            # Embedding indexes
-            ("idx_episode_emb_episode", "CREATE INDEX IF NOT EXISTS idx_episode_emb_episode ON episode_embeddings(episode_id);"),
-            ("idx_skill_emb_skill", "CREATE INDEX IF NOT EXISTS idx_skill_emb_skill ON skill_embeddings(skill_id);"),
-            ("idx_note_emb_note", "CREATE INDEX IF NOT EXISTS idx_note_emb_note ON note_embeddings(note_id);"),
-            ("idx_exp_node_emb_node", "CREATE INDEX IF NOT EXISTS idx_exp_node_emb_node ON exp_node_embeddings(node_id);"),
-
-            # Skill indexes
-            ("idx_skills_name", "CREATE INDEX IF NOT EXISTS idx_skills_name ON skills(name);"),
-            ("idx_skill_links_episode", "CREATE INDEX IF NOT EXISTS idx_skill_links_episode ON skill_links(episode_id);"),
-            ("idx_skill_links_skill", "CREATE INDEX IF NOT EXISTS idx_skill_links_skill ON skill_links(skill_id);"),
-
-            # Learning indexes
-            ("idx_learning_exp_session", "CREATE INDEX IF NOT EXISTS idx_learning_exp_session ON learning_experiences(session_id);"),
-            ("idx_learning_sessions_algo", "CREATE INDEX IF NOT EXISTS idx_learning_sessions_algo ON learning_sessions(algorithm);"),
-
-            # Memory indexes
-            ("idx_memory_scores_episode", "CREATE INDEX IF NOT EXISTS idx_memory_scores_episode ON memory_scores(episode_id);"),
-            ("idx_memory_scores_composite", "CREATE INDEX IF NOT EXISTS idx_memory_scores_composite ON memory_scores(composite_score DESC);"),
-            ("idx_memory_access_episode", "CREATE INDEX IF NOT EXISTS idx_memory_access_episode ON memory_access_log(episode_id);"),
-
-            # Causal indexes
-            ("idx_causal_edges_cause", "CREATE INDEX IF NOT EXISTS idx_causal_edges_cause ON causal_edges(cause_id);"),
-            ("idx_causal_edges_effect", "CREATE INDEX IF NOT EXISTS idx_causal_edges_effect ON causal_edges(effect_id);"),
-
-            # Event indexes
-            ("idx_events_type", "CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);"),
-            ("idx_events_timestamp", "CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp);"),
-        ]
+        Call this after bulk-loading data into a database initialized with
+        ``defer_indexes=True``: building each index once over the loaded rows is
+        cheaper than maintaining every index on every insert. Commits any
+        transaction still open on ``conn`` first.
+        """
+        self._execute_in_transaction(conn, INDEX_SQL)
+        self._report_indexes()
+        # initialize() analyzed before any index existed; give the planner stats for them
+        conn.execute("ANALYZE;")
 
-        for idx_name, idx_sql in indexes:
-            cursor.execute(idx_sql)
-            print(f"  ✓ {idx_name}")
+    def _report_indexes(self):
+        """Print the list of created indexes."""
+        print("\n🚀 Creating indexes...")
+        self._report_created(name for name, _ in INDEXES)
 
-        conn.commit()
+    def _report_created(self, names):
+        """Write the per-object checklist in one call (verbose mode only)."""
+        if self.verbose:
+            sys.stdout.write("".join(f"  ✓ {name}\n" for name in names))
 
     def validate_schema(self, conn: sqlite3.Connection) -> bool:
         """Validate that all required tables exist with correct structure."""
@@ -470,20 +673,20 @@ class AgentDBInitializer:
 
         print("\n🔍 Validating schema...")
 
-        required_tables = [
-            'episodes', 'episode_embeddings', 'skills', 'skill_embeddings', 'skill_links',
-            'facts', 'notes', 'note_embeddings', 'causal_edges', 'causal_experiments',
-            'causal_observations', 'exp_nodes', 'exp_edges', 'exp_node_embeddings',
-            'learning_experiences', 'learning_sessions', 'consolidated_memories',
-            'consolidation_runs', 'memory_scores', 'memory_access_log',
-            'provenance_sources', 'justification_paths', 'recall_certificates',
-            'events', 'learning_algorithms'
-        ]
+        required_tables = [name for name, _ in TABLES]
 
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        existing_tables = {row[0] for row in cursor.fetchall()}
+        # One round-trip for both checks: every table with its column names.
+        # Virtual tables are skipped: pragma_table_info on one whose module is not
+        # loaded (e.g. vss0) raises "no such module" and would abort validation.
+        cursor.execute("""
+            SELECT m.name, group_concat(p.name)
+            FROM sqlite_master m, pragma_table_info(m.name) p
+            WHERE m.type = 'table' AND m.sql NOT LIKE 'CREATE VIRTUAL TABLE%'
+            GROUP BY m.name;
+        """)
+        table_columns = {name: set(columns.split(',')) for name, columns in cursor.fetchall()}
 
-        missing_tables = set(required_tables) - existing_tables
+        missing_tables = set(required_tables) - table_columns.keys()
 
         if missing_tables:
             print(f"❌ Missing tables: {missing_tables}")
@@ -492,50 +695,106 @@ class AgentDBInitializer:
         print(f"✓ All {len(required_tables)} required tables exist")
 
         # Validate key columns on critical tables
-        cursor.execute("PRAGMA table_info(episodes);")
-        episodes_cols = {row[1] for row in cursor.fetchall()}
-        required_episode_cols = {'id', 'ts', 'task', 'input', 'output', 'reward', 'created_at'}
-
-        if not required_episode_cols.issubset(episodes_cols):
-            print(f"❌ Episodes table missing columns: {required_episode_cols - episodes_cols}")
-            return False
+        for table_name, required_cols in REQUIRED_COLUMNS.items():
+            missing_cols = required_cols - table_columns.get(table_name, set())
+            if missing_cols:
+                print(f"❌ {table_name} table missing columns: {missing_cols}")
+                return False
 
         print("✓ Schema validation passed")
         return True
 
-    def initialize(self, force: bool = False):
-        """Run complete initialization process."""
+    def _legacy_embedding_tables(self, conn: sqlite3.Connection) -> list[str]:
+        """Return embedding tables still in the pre-``embedding_models`` layout.
+
+        Those tables lack ``model_id``/``quant_scheme``, so the current indexes
+        cannot be built on them and CREATE TABLE IF NOT EXISTS will not upgrade them.
+        """
+        placeholders = ", ".join("?" * len(EMBEDDING_TABLES))
+        rows = conn.execute(f"""
+            SELECT m.name
+            FROM sqlite_master m
+            WHERE m.type = 'table' AND m.name IN ({placeholders})
+              AND NOT EXISTS (
+                  SELECT 1 FROM pragma_table_info(m.name) p WHERE p.name = 'model_id'
+              )
+            ORDER BY m.name;
+        """, EMBEDDING_TABLES).fetchall()
+        return [row[0] for row in rows]
+
+    def initialize(self, force: bool = False, defer_indexes: bool = False):
+        """Run complete initialization process.
+
+        Args:
+            force: Reinitialize an existing database without prompting
+            defer_indexes: Create tables only; the caller runs create_indexes()
+                after its bulk load
+        """
         print("=" * 60)
         print("AgentDB ReasoningBank Database Initialization")
         print("=" * 60)
 
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            required = ".".join(map(str, MIN_SQLITE_VERSION))
+            print(f"\n❌ SQLite {sqlite3.sqlite_version} is too old: the schema needs {required}+ "
+                  "(STRICT tables, unixepoch() defaults)")
+            print("   Use a Python build linked against a newer SQLite")
+            return False
+
         # Create directory
         self.create_database_directory()
 
+        # Single existence check, reused below (no repeated stat, no race between checks)
+        pre_existed = self.db_path.exists()
+
         # Backup existing database
-        if self.backup and os.path.exists(self.db_path):
+        if self.backup and pre_existed:
             if not force:
                 response = input("\n⚠️  Database exists. Backup and reinitialize? (y/N): ")
                 if response.lower() != 'y':
                     print("Aborted.")
                     return False
-            self.backup_existing_db()
+            self.backup_existing_db(pre_existed)
 
         # Connect and initialize
         print(f"\n🔧 Initializing database: {self.db_path}")
-        conn = sqlite3.connect(self.db_path)
+        is_new_db = not pre_existed
+        # The template already carries every index, so it cannot serve deferred-index setups
+        from_template = is_new_db and not defer_indexes and self._copy_template()
+        # isolation_level=None: transactions are managed explicitly in initialize_schema
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
 
         try:
-            self.initialize_schema(conn)
-            self.create_indexes(conn)
+            if from_template:
+                # Schema, indexes and seed rows are already in the file
+                self._configure_pragmas(conn)
+            else:
+                legacy = self._legacy_embedding_tables(conn) if pre_existed else []
+                if legacy:
+                    print(f"\n❌ Schema predates embedding_models: {', '.join(legacy)} "
+                          "lack the model_id column")
+                    print("   Re-create the database: move it aside and run init_agentdb.py again")
+                    return False
+
+                self._configure_pragmas(conn, bulk_load=is_new_db)
+                self.initialize_schema(conn, with_indexes=not defer_indexes)
+                if is_new_db:
+                    # Restore WAL, synchronous=NORMAL and foreign keys before handing the file over
+                    self._configure_pragmas(conn)
 
             if self.validate_schema(conn):
+                # Give the query planner statistics before the first real workload
+                conn.execute("ANALYZE;")
+
                 print("\n" + "=" * 60)
                 print("✅ Database initialization complete!")
                 print("=" * 60)
-                print(f"📍 Database location: {os.path.abspath(self.db_path)}")
-                print(f"📊 Tables created: 25")
-                print(f"🚀 Indexes created: {len([i for i in range(15)])}")
+                print(f"📍 Database location: {self.db_path.resolve()}")
+                print(f"📊 Tables created: {len(TABLES)}")
+                if defer_indexes:
+                    print("🚀 Indexes deferred: call AgentDBInitializer(db_path).create_indexes(conn) after loading data")
+                else:
+                    print(f"🚀 Indexes created: {len(INDEXES)}")
                 return True
             else:
                 print("\n❌ Schema validation failed")
@@ -545,7 +804,7 @@ class AgentDBInitializer:
             print(f"\n❌ Error during initialization: {e}")
             return False
         finally:
-            conn.close()
+            self.close_gracefully(conn)
 
 
 def main():
@@ -559,6 +818,8 @@ Examples:
   python scripts/init_agentdb.py --force            # Force reinitialize
   python scripts/init_agentdb.py --no-backup        # Skip backup
   python scripts/init_agentdb.py --db custom.db     # Custom database path
+  python scripts/init_agentdb.py --verbose          # List every table and index
+  python scripts/init_agentdb.py --defer-indexes    # Tables only, index after bulk load
         """
     )
 
@@ -577,15 +838,26 @@ Examples:
         action='store_true',
         help='Skip backup of existing database'
     )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='List each created table and index'
+    )
+    parser.add_argument(
+        '--defer-indexes',
+        action='store_true',
+        help='Create tables only; build indexes after bulk-loading data'
+    )
 
     args = parser.parse_args()
 
     initializer = AgentDBInitializer(
         db_path=args.db,
-        backup=not args.no_backup
+        backup=not args.no_backup,
+        verbose=args.verbose
     )
 
-    success = initializer.initialize(force=args.force)
+    success = initializer.initialize(force=args.force, defer_indexes=args.defer_indexes)
     exit(0 if success else 1)
 
 
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+AgentDB Similarity Kernel Source
+
+Single pure-Python definition of the embedding similarity kernels. It is
+compiled ahead of time by scripts/_build_simkernels.py and just in time with
+``@njit`` by test_agentdb.py when the prebuilt ``simkernels`` module is absent.
+Requires numba.
+"""
+
+import numpy as np
+from numba import prange
+
+
+def batch_cosine(mat, q):
+    """Cosine similarity of every row of mat against q (norm and dot fused in one pass)."""
+    n = mat.shape[0]
+    out = np.empty(n, np.float32)
+    qn = 0.0
+    for k in range(q.shape[0]):
+        qn += q[k] * q[k]
+    qn = qn ** 0.5
+    # prange parallelizes under njit(parallel=True) and is a plain range otherwise
+    for i in prange(n):
+        dot = 0.0
+        mn = 0.0
+        for k in range(mat.shape[1]):
+            dot += mat[i, k] * q[k]
+            mn += mat[i, k] * mat[i, k]
+        out[i] = dot / ((mn ** 0.5) * qn)
+    return out
@@ -6,25 +6,130 @@ Comprehensive tests for database initialization, embedding storage,
 similarity search, and schema validation.
 
 Usage:
-    python scripts/test_agentdb.py [--db PATH] [--verbose]
+    python scripts/test_agentdb.py [--db PATH] [--inmemory] [--verbose]
 """
 
 import sqlite3
 import os
 import sys
 import argparse
+import threading
+import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from init_agentdb import (
+    AgentDBInitializer, EMBEDDING_DIM, INDEX_SQL, SCHEMA_SQL, SEED_SQL, pack_int8, unpack_int8
+)
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; batch_cosine falls back to NumPy
+    njit = None
+
+try:
+    import sqlite_vss
+except ImportError:  # sqlite-vss is optional; similarity search falls back to a NumPy scan
+    sqlite_vss = None
+
+# Stored embedding layout (see init_agentdb.pack_int8): int8[EMBEDDING_DIM] followed by a float32 scale
+PACKED_EMBEDDING_BYTES = EMBEDDING_DIM + 4
+FP32_EMBEDDING_BYTES = EMBEDDING_DIM * 4
+# Structured view of one packed row, so N concatenated BLOBs parse in a single frombuffer
+EMB_DTYPE = np.dtype([('vec', np.int8, EMBEDDING_DIM), ('scale', np.float32)])
+
+
+def _unit(v: np.ndarray) -> np.ndarray:
+    """Return v scaled to unit L2 norm (zero vectors are returned unchanged)."""
+    n = np.linalg.norm(v)
+    return v / n if n else v
+
+
+def _load_vss(conn: sqlite3.Connection) -> bool:
+    """Load the sqlite-vss extensions into conn; False when unavailable."""
+    try:
+        conn.enable_load_extension(True)
+        try:
+            if sqlite_vss is not None:
+                sqlite_vss.load(conn)
+            else:
+                conn.load_extension('vector0')
+                conn.load_extension('vss0')
+        finally:
+            conn.enable_load_extension(False)
+    except (AttributeError, sqlite3.OperationalError):
+        # AttributeError: Python built against a SQLite without extension loading
+        return False
+    return True
+
+
+try:
+    # Ahead-of-time build from scripts/_build_simkernels.py: no JIT cost per process
+    from simkernels import batch_cosine
+except ImportError:
+    if njit is not None:
+        # Same source the AOT build compiles, so the two kernels cannot drift
+        from simkernels_src import batch_cosine as _batch_cosine_src
+        batch_cosine = njit(parallel=True, fastmath=True, cache=True)(_batch_cosine_src)
+    else:
+        def batch_cosine(mat, q):
+            """Cosine similarity of every row of mat against q."""
+            return (mat @ q) / (np.linalg.norm(mat, axis=1) * np.linalg.norm(q))
+
 
 class AgentDBTester:
     """Test suite for AgentDB ReasoningBank database."""
 
-    def __init__(self, db_path: str = ".agentdb/reasoningbank.db", verbose: bool = False):
-        self.db_path = db_path
+    def __init__(self, db_path: str = ".agentdb/reasoningbank.db", verbose: bool = False,
+                 inmemory: bool = False):
+        self.inmemory = inmemory
+        self.db_path = ":memory:" if inmemory else db_path
         self.verbose = verbose
+        if inmemory:
+            # Named shared-cache memory DB, so every per-thread connection sees the same data
+            self._uri = f"file:agentdb_test_{id(self)}?mode=memory&cache=shared"
+        else:
+            # mode=rw: never create an empty database as a side effect
+            self._uri = Path(db_path).resolve().as_uri() + "?mode=rw"
         self.test_results = []
+        # One connection per thread; all tracked so close() can release them
+        self._local = threading.local()
+        self._conns = []
+        self._lock = threading.Lock()
+        # One seeded generator for every test: deterministic, vectorized draws
+        self._rng = np.random.default_rng(0xC0FFEE)
+        # Schema snapshot, filled once by _introspect()
+        self._tables = None
+        self._indexes = None
+        self._cols = None
+        self._schema_lock = threading.Lock()
+
+        if inmemory:
+            # The main-thread connection keeps the memory DB alive until close()
+            self.conn.executescript("\n".join((SCHEMA_SQL, INDEX_SQL, SEED_SQL)))
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use and reused by every test."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode = WAL;")
+            AgentDBInitializer.apply_runtime_pragmas(conn)
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def close(self):
+        """Close every connection opened by the tester."""
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
+        self._local = threading.local()
 
     def log(self, message: str, level: str = "INFO"):
         """Log message if verbose mode enabled."""
@@ -34,20 +139,62 @@ class AgentDBTester:
 
     def run_test(self, test_name: str, test_func):
         """Run a single test and record result."""
-        print(f"\n🧪 {test_name}...", end=" ")
+        return self._report(self._execute(test_name, test_func))
+
+    def run_tests_parallel(self, tests, max_workers: int = 4):
+        """Run independent read-only tests on a thread pool; report in the given order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = list(pool.map(lambda test: self._execute(*test), tests))
+        return [self._report(outcome) for outcome in outcomes]
+
+    def _execute(self, test_name: str, test_func):
+        """Run test_func and return (name, status, error) without printing."""
         try:
             test_func()
-            print("✅ PASSED")
-            self.test_results.append((test_name, True, None))
-            return True
+            return test_name, "PASSED", None
         except AssertionError as e:
-            print(f"❌ FAILED: {e}")
-            self.test_results.append((test_name, False, str(e)))
-            return False
+            self._rollback()
+            return test_name, "FAILED", str(e)
         except Exception as e:
-            print(f"❌ ERROR: {e}")
-            self.test_results.append((test_name, False, f"Exception: {e}"))
-            return False
+            self._rollback()
+            return test_name, "ERROR", str(e)
+
+    def _report(self, outcome):
+        """Print and record one test outcome."""
+        test_name, status, error = outcome
+        print(f"\n🧪 {test_name}...", end=" ")
+        if status == "PASSED":
+            print("✅ PASSED")
+        else:
+            print(f"❌ {status}: {error}")
+        if status == "ERROR":
+            error = f"Exception: {error}"
+        self.test_results.append((test_name, status == "PASSED", error))
+        return status == "PASSED"
+
+    def _introspect(self):
+        """Read tables, indexes and column types once; schema tests reuse the snapshot."""
+        with self._schema_lock:
+            if self._tables is not None:
+                return
+            names = self.conn.execute(
+                "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index');"
+            ).fetchall()
+            self._tables = {name for kind, name in names if kind == 'table'}
+            self._indexes = {name for kind, name in names if kind == 'index'}
+            self._cols = {table: {} for table in self._tables}
+            for table, col, col_type in self.conn.execute("""
+                SELECT m.name, p.name, p.type
+                FROM sqlite_master AS m, pragma_table_info(m.name) AS p
+                WHERE m.type = 'table' AND m.sql NOT LIKE 'CREATE VIRTUAL TABLE%';
+            """):
+                self._cols[table][col] = col_type
+
+    def _rollback(self):
+        """Discard uncommitted writes so a failed test cannot leak into the next."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and conn.in_transaction:
+            conn.rollback()
 
     def test_database_exists(self):
         """Test that database file exists."""
@@ -67,16 +214,12 @@ class AgentDBTester:
             'events', 'learning_algorithms'
         ]
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        existing_tables = {row[0] for row in cursor.fetchall()}
+        self._introspect()
+        existing_tables = self._tables
 
         self.log(f"Found {len(existing_tables)} tables: {existing_tables}")
 
         missing = set(required_tables) - existing_tables
-        conn.close()
 
         assert len(missing) == 0, f"Missing tables: {missing}"
         assert len(existing_tables) >= 25, f"Expected at least 25 tables, found {len(existing_tables)}"
@@ -86,16 +229,11 @@ class AgentDBTester:
         required_columns = ['id', 'ts', 'task', 'input', 'output', 'critique',
                           'reward', 'success', 'created_at']
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("PRAGMA table_info(episodes);")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
+        self._introspect()
+        columns = self._cols.get('episodes', {})
 
         self.log(f"Episodes columns: {columns}")
 
-        conn.close()
-
         for col in required_columns:
             assert col in columns, f"Missing column '{col}' in episodes table"
 
@@ -104,27 +242,30 @@ class AgentDBTester:
         embedding_tables = ['episode_embeddings', 'skill_embeddings',
                           'note_embeddings', 'exp_node_embeddings']
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self._introspect()
+        cursor = self.conn.cursor()
 
         for table in embedding_tables:
-            cursor.execute(f"PRAGMA table_info({table});")
-            columns = {row[1]: row[2] for row in cursor.fetchall()}
+            columns = self._cols.get(table, {})
 
             self.log(f"{table} columns: {columns}")
 
             assert 'embedding' in columns, f"Missing 'embedding' column in {table}"
-            assert 'embedding_model' in columns, f"Missing 'embedding_model' column in {table}"
+            assert 'model_id' in columns, f"Missing 'model_id' column in {table}"
 
-        conn.close()
+            # Stored vectors are int8-quantized; legacy FP32 rows remain readable
+            cursor.execute(f"SELECT DISTINCT length(embedding) FROM {table};")
+            lengths = {row[0] for row in cursor.fetchall()}
+            unexpected = lengths - {PACKED_EMBEDDING_BYTES, FP32_EMBEDDING_BYTES}
+            assert not unexpected, f"Unexpected embedding sizes in {table}: {unexpected}"
 
     def test_insert_episode(self):
         """Test inserting an episode."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         episode_data = {
-            'ts': datetime.now().timestamp(),
+            'ts': time.time(),
             'session_id': 'test_session_001',
             'task': 'Test task execution',
             'input': 'Test input data',
@@ -141,8 +282,9 @@ class AgentDBTester:
         cursor.execute("""
             INSERT INTO episodes (ts, session_id, task, input, output, critique,
                                 reward, success, latency_ms, tokens_used, tags, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, tuple(episode_data.values()))
+            VALUES (:ts, :session_id, :task, :input, :output, :critique,
+                    :reward, :success, :latency_ms, :tokens_used, :tags, :metadata)
+        """, episode_data)
 
         episode_id = cursor.lastrowid
         self.log(f"Inserted episode with ID: {episode_id}")
@@ -152,121 +294,173 @@ class AgentDBTester:
         result = cursor.fetchone()
 
         conn.commit()
-        conn.close()
 
         assert result is not None, "Episode not found after insertion"
         assert result[3] == 'Test task execution', "Task data mismatch"
 
     def test_insert_embedding(self):
         """Test storing embedding vector."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
         # Create test episode first
         cursor.execute("""
             INSERT INTO episodes (ts, task, input, output)
             VALUES (?, ?, ?, ?)
-        """, (datetime.now().timestamp(), 'Embedding test', 'input', 'output'))
+        """, (time.time(), 'Embedding test', 'input', 'output'))
 
         episode_id = cursor.lastrowid
 
-        # Create random embedding (384 dimensions, typical for all-MiniLM-L6-v2)
-        embedding_vector = np.random.randn(384).astype(np.float32)
-        embedding_blob = embedding_vector.tobytes()
+        # Create random embedding (EMBEDDING_DIM dimensions, all-MiniLM-L6-v2 size).
+        # Stored embeddings are unit-normalized so retrieval is a plain dot product.
+        embedding_vector = _unit(self._rng.standard_normal(EMBEDDING_DIM, dtype=np.float32))
+        assert abs(np.linalg.norm(embedding_vector) - 1.0) < 1e-5, "Embedding not unit-normalized"
+        embedding_blob = pack_int8(embedding_vector)
 
         self.log(f"Embedding vector shape: {embedding_vector.shape}, dtype: {embedding_vector.dtype}")
 
         cursor.execute("""
-            INSERT INTO episode_embeddings (episode_id, embedding, embedding_model)
+            INSERT INTO episode_embeddings (episode_id, embedding, model_id)
             VALUES (?, ?, ?)
-        """, (episode_id, embedding_blob, 'all-MiniLM-L6-v2'))
+        """, (episode_id, embedding_blob, 1))
 
         # Retrieve and verify
         cursor.execute("SELECT embedding FROM episode_embeddings WHERE episode_id = ?", (episode_id,))
         result = cursor.fetchone()
 
         conn.commit()
-        conn.close()
 
         assert result is not None, "Embedding not found"
 
-        retrieved_vector = np.frombuffer(result[0], dtype=np.float32)
+        assert len(result[0]) == PACKED_EMBEDDING_BYTES, f"Unexpected BLOB size: {len(result[0])}"
+
+        # BLOB storage is bit-exact: compare the packed bytes, not the lossy decoded floats
+        assert result[0] == embedding_blob, "Vector data mismatch"
+
+        # int8 quantization error is bounded by half a quantization step
+        retrieved_vector = unpack_int8(result[0])
         assert retrieved_vector.shape == embedding_vector.shape, "Shape mismatch"
-        assert np.allclose(retrieved_vector, embedding_vector), "Vector data mismatch"
+        step = np.abs(embedding_vector).max() / 127
+        assert np.allclose(retrieved_vector, embedding_vector, rtol=0, atol=step), "Dequantized vector mismatch"
 
     def test_similarity_search(self):
         """Test basic similarity search capability."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
-        # Insert multiple episodes with embeddings
-        embeddings = []
-        episode_ids = []
+        # Create distinct unit-norm embeddings; the first one doubles as the query
+        num_episodes = 5
+        all_embs = self._rng.standard_normal((num_episodes, EMBEDDING_DIM), dtype=np.float32)
+        embeddings = [_unit(all_embs[i]) for i in range(num_episodes)]
+        query_embedding = embeddings[0].copy()
 
-        for i in range(5):
-            cursor.execute("""
-                INSERT INTO episodes (ts, task, input, output)
-                VALUES (?, ?, ?, ?)
-            """, (datetime.now().timestamp(), f'Task {i}', f'input {i}', f'output {i}'))
+        # Insert all episodes and embeddings in one transaction, one statement per table
+        base_ts = time.time()
+        cursor.execute("BEGIN")
+        cursor.executemany("""
+            INSERT INTO episodes (ts, task, input, output)
+            VALUES (?, ?, ?, ?)
+        """, [(base_ts + i * 1e-3, f'Task {i}', f'input {i}', f'output {i}')
+              for i in range(num_episodes)])
 
-            episode_id = cursor.lastrowid
-            episode_ids.append(episode_id)
+        # AUTOINCREMENT ids within a single write transaction are consecutive
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
+        episode_ids = list(range(last_id - num_episodes + 1, last_id + 1))
 
-            # Create distinct embeddings
-            embedding = np.random.randn(384).astype(np.float32)
-            if i == 0:
-                query_embedding = embedding.copy()  # Save first as query
+        packed_rows = [pack_int8(embedding) for embedding in embeddings]
+        cursor.executemany("""
+            INSERT INTO episode_embeddings (episode_id, embedding)
+            VALUES (?, ?)
+        """, list(zip(episode_ids, packed_rows)))
 
-            embeddings.append(embedding)
+        conn.commit()
 
-            cursor.execute("""
-                INSERT INTO episode_embeddings (episode_id, embedding)
-                VALUES (?, ?)
-            """, (episode_id, embedding.tobytes()))
+        if _load_vss(conn):
+            similarities = self._vss_search(episode_ids, packed_rows, query_embedding, num_episodes)
+        else:
+            similarities = self._scan_search(query_embedding)
 
-        conn.commit()
+        self.log(f"Similarity scores: {similarities}")
 
-        # Perform similarity search (cosine similarity)
-        cursor.execute("SELECT episode_id, embedding FROM episode_embeddings")
-        results = cursor.fetchall()
+        # The query itself should rank first; with a seeded generator, earlier runs
+        # on the same database store identical vectors that tie with it
+        top_score = similarities[0][1]
+        query_score = dict(similarities).get(episode_ids[0], -1.0)
+        assert query_score >= top_score - 1e-6, "Most similar should be the query itself"
+        assert top_score > 0.99, "Self-similarity should be ~1.0"
 
-        similarities = []
-        for ep_id, emb_blob in results:
-            stored_emb = np.frombuffer(emb_blob, dtype=np.float32)
+    def _vss_search(self, episode_ids, packed_rows, query, k):
+        """Top-k through a vss0 index: the engine ranks rows, nothing is scanned in Python.
 
-            # Cosine similarity
-            similarity = np.dot(query_embedding, stored_emb) / (
-                np.linalg.norm(query_embedding) * np.linalg.norm(stored_emb)
-            )
-            similarities.append((ep_id, similarity))
+        The index lives in the temp schema and holds only this run's rows, so the
+        user's database never gains a table that needs the extension to open.
+        """
+        try:
+            with self.conn:
+                self.conn.execute(
+                    f"CREATE VIRTUAL TABLE temp.episode_vss USING vss0(embedding({EMBEDDING_DIM}));"
+                )
+                # vss0 indexes float32; index the dequantized vectors so scores match the scan path
+                self.conn.executemany(
+                    "INSERT INTO temp.episode_vss (rowid, embedding) VALUES (?, ?);",
+                    [(episode_id, unpack_int8(blob).tobytes())
+                     for episode_id, blob in zip(episode_ids, packed_rows)]
+                )
+
+            rows = self.conn.execute("""
+                SELECT rowid, distance FROM temp.episode_vss
+                WHERE vss_search(embedding, vss_search_params(?, ?));
+            """, (query.astype(np.float32).tobytes(), k)).fetchall()
+        finally:
+            with self.conn:
+                self.conn.execute("DROP TABLE IF EXISTS temp.episode_vss;")
+
+        # Squared L2 between unit vectors is 2 - 2cos, so cosine = 1 - d/2
+        return [(episode_id, 1.0 - distance / 2.0) for episode_id, distance in rows]
+
+    def _read_packed_embeddings(self):
+        """Load every int8-packed episode embedding as an (N,) EMB_DTYPE array plus episode ids."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT episode_id, embedding FROM episode_embeddings
+            WHERE length(embedding) = ?
+            ORDER BY episode_id
+        """, (PACKED_EMBEDDING_BYTES,))
+        ids, blobs = zip(*cursor.fetchall())
+        packed = np.frombuffer(b''.join(blobs), dtype=EMB_DTYPE)
+        assert packed.shape == (len(ids),), f"Wrong packed shape: {packed.shape}"
+        return packed, np.array(ids)
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+    def _scan_search(self, query):
+        """Exact cosine scan over every int8-quantized row, ranked in NumPy."""
+        packed, ids = self._read_packed_embeddings()
 
-        self.log(f"Similarity scores: {similarities}")
+        # Dequantize all rows at once: int8 codes times each row's float32 scale
+        matrix = packed['vec'].astype(np.float32) * packed['scale'][:, None]
 
-        conn.close()
+        # One compiled (or vectorized) kernel scores every stored row against the query
+        scores = batch_cosine(matrix, np.ascontiguousarray(query, dtype=np.float32))
 
-        # First result should be the query itself (highest similarity)
-        assert similarities[0][0] == episode_ids[0], "Most similar should be the query itself"
-        assert similarities[0][1] > 0.99, "Self-similarity should be ~1.0"
+        # Sort by similarity
+        order = np.argsort(-scores)
+        return [(int(ids[i]), float(scores[i])) for i in order]
 
     def test_foreign_key_constraints(self):
         """Test foreign key relationships work correctly."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
+        conn = self.conn
         cursor = conn.cursor()
 
         # Create parent episode
         cursor.execute("""
             INSERT INTO episodes (ts, task, input, output)
             VALUES (?, ?, ?, ?)
-        """, (datetime.now().timestamp(), 'FK test', 'input', 'output'))
+        """, (time.time(), 'FK test', 'input', 'output'))
 
         episode_id = cursor.lastrowid
 
         # Create child records
-        embedding = np.random.randn(384).astype(np.float32).tobytes()
+        embedding = pack_int8(_unit(self._rng.standard_normal(EMBEDDING_DIM, dtype=np.float32)))
         cursor.execute("""
             INSERT INTO episode_embeddings (episode_id, embedding)
             VALUES (?, ?)
@@ -295,7 +489,6 @@ class AgentDBTester:
         assert cursor.fetchone()[0] == 0, "Memory score not cascaded"
 
         conn.commit()
-        conn.close()
 
     def test_indexes_exist(self):
         """Test that performance indexes are created."""
@@ -306,39 +499,35 @@ class AgentDBTester:
             'idx_memory_scores_composite'
         ]
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='index';")
-        existing_indexes = {row[0] for row in cursor.fetchall()}
+        self._introspect()
+        existing_indexes = self._indexes
 
         self.log(f"Found indexes: {existing_indexes}")
 
-        conn.close()
-
         for idx in required_indexes:
             assert idx in existing_indexes, f"Missing index: {idx}"
 
     def test_skill_learning_workflow(self):
         """Test complete skill learning workflow."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
 
+        # Each write hands back what the next step needs via RETURNING (SQLite 3.35+),
+        # so no separate lastrowid lookups or verification SELECT are needed
+
         # 1. Create skill
-        cursor.execute("""
+        skill_id = cursor.execute("""
             INSERT INTO skills (name, description, code, success_rate)
             VALUES (?, ?, ?, ?)
-        """, ('test_skill', 'A test skill', 'def test(): pass', 0.0))
-
-        skill_id = cursor.lastrowid
+            RETURNING id
+        """, ('test_skill', 'A test skill', 'def test(): pass', 0.0)).fetchone()[0]
 
         # 2. Create episode
-        cursor.execute("""
+        episode_id = cursor.execute("""
             INSERT INTO episodes (ts, task, input, output, reward, success)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, (datetime.now().timestamp(), 'skill test', 'input', 'output', 0.9, 1))
-
-        episode_id = cursor.lastrowid
+            RETURNING id
+        """, (time.time(), 'skill test', 'input', 'output', 0.9, 1)).fetchone()[0]
 
         # 3. Link skill to episode
         cursor.execute("""
@@ -346,26 +535,20 @@ class AgentDBTester:
             VALUES (?, ?, ?)
         """, (episode_id, skill_id, 0.95))
 
-        # 4. Update skill stats
-        cursor.execute("""
+        # 4. Update skill stats; RETURNING reads the workflow back through the link
+        result = cursor.execute("""
             UPDATE skills
             SET success_rate = 0.9, usage_count = usage_count + 1
             WHERE id = ?
-        """, (skill_id,))
-
-        # Verify workflow
-        cursor.execute("""
-            SELECT s.name, s.success_rate, e.reward
-            FROM skills s
-            JOIN skill_links sl ON s.id = sl.skill_id
-            JOIN episodes e ON sl.episode_id = e.id
-            WHERE s.id = ?
-        """, (skill_id,))
-
-        result = cursor.fetchone()
+            RETURNING name, success_rate, (
+                SELECT e.reward
+                FROM skill_links sl
+                JOIN episodes e ON sl.episode_id = e.id
+                WHERE sl.skill_id = skills.id
+            )
+        """, (skill_id,)).fetchone()
 
         conn.commit()
-        conn.close()
 
         assert result is not None, "Skill learning workflow incomplete"
         assert result[0] == 'test_skill', "Skill name mismatch"
@@ -403,16 +586,25 @@ class AgentDBTester:
         print(f"Verbose: {self.verbose}")
 
         # Run all tests
-        self.run_test("Database file exists", self.test_database_exists)
-        self.run_test("All 25 tables exist", self.test_all_tables_exist)
-        self.run_test("Episodes table structure", self.test_episodes_table_structure)
-        self.run_test("Embedding tables structure", self.test_embedding_tables_structure)
-        self.run_test("Insert episode", self.test_insert_episode)
-        self.run_test("Insert and retrieve embedding", self.test_insert_embedding)
-        self.run_test("Similarity search", self.test_similarity_search)
-        self.run_test("Foreign key constraints", self.test_foreign_key_constraints)
-        self.run_test("Performance indexes", self.test_indexes_exist)
-        self.run_test("Skill learning workflow", self.test_skill_learning_workflow)
+        try:
+            # Schema inspection only reads, so it runs concurrently (WAL readers never block)
+            schema_tests = [
+                ("All 25 tables exist", self.test_all_tables_exist),
+                ("Episodes table structure", self.test_episodes_table_structure),
+                ("Embedding tables structure", self.test_embedding_tables_structure),
+                ("Performance indexes", self.test_indexes_exist),
+            ]
+            if not self.inmemory:
+                schema_tests.insert(0, ("Database file exists", self.test_database_exists))
+            self.run_tests_parallel(schema_tests)
+            # Writers run serially afterwards to avoid WAL writer contention
+            self.run_test("Insert episode", self.test_insert_episode)
+            self.run_test("Insert and retrieve embedding", self.test_insert_embedding)
+            self.run_test("Similarity search", self.test_similarity_search)
+            self.run_test("Foreign key constraints", self.test_foreign_key_constraints)
+            self.run_test("Skill learning workflow", self.test_skill_learning_workflow)
+        finally:
+            self.close()
 
         return self.print_summary()
 
@@ -429,6 +621,11 @@ def main():
         default='.agentdb/reasoningbank.db',
         help='Database path (default: .agentdb/reasoningbank.db)'
     )
+    parser.add_argument(
+        '--inmemory',
+        action='store_true',
+        help='Build the schema in a private in-memory database instead of using --db'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -437,7 +634,7 @@ def main():
 
     args = parser.parse_args()
 
-    tester = AgentDBTester(db_path=args.db, verbose=args.verbose)
+    tester = AgentDBTester(db_path=args.db, verbose=args.verbose, inmemory=args.inmemory)
 
     success = tester.run_all_tests()
     exit(0 if success else 1)